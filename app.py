@@ -8,13 +8,19 @@ Run with:
 """
 
 import streamlit as st
-import json
+import pandas as pd
+import asyncio
+import hashlib
+import orjson
 import os
-from datetime import datetime
+import tempfile
+import textwrap
+import threading
+from datetime import datetime, timedelta
+from types import MappingProxyType
 from dotenv import load_dotenv
 
-# Load environment variables (override=True to pick up changes)
-load_dotenv(override=True)
+from src.utils.serialization import STATE_JSON_OPTIONS, dumps_state, loads_state
 
 # Page config
 st.set_page_config(
@@ -44,16 +50,164 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# Pipeline agents in execution order: node name -> (icon, display name, description)
+AGENT_INFO = {
+    "strategist": ("🔍", "Strategist", "Searching for pain points"),
+    "critic": ("✓", "Critic", "Verifying with statistics"),
+    "infiltrator": ("🕵️", "Infiltrator", "Analyzing competitors"),
+    "anthropologist": ("👥", "Anthropologist", "Creating personas"),
+    "analyzer": ("📊", "Analyzer", "Building competitor matrix"),
+    "innovator": ("💡", "Innovator", "Proposing features"),
+    "auditor": ("💰", "Auditor", "Validating financials"),
+    "pdf_compiler": ("📄", "PDF Compiler", "Generating report"),
+}
+AGENTS = tuple(AGENT_INFO.values())
+
+# Env var and placeholder value for each required API key
+API_KEY_ENV_VARS = {
+    "perplexity": ("PERPLEXITY_API_KEY", "your_perplexity_api_key_here"),
+    "google": ("GOOGLE_API_KEY", "your_google_api_key_here"),
+    "tavily": ("TAVILY_API_KEY", "your_tavily_api_key_here"),
+}
+
+
+@st.cache_resource(show_spinner=False)
+def _api_keys_configured():
+    """
+    Load .env once per process and report which API keys are configured.
+    
+    Returns a read-only mapping of provider -> bool. Restart the app (or clear
+    the resource cache) to pick up changes to .env.
+    """
+    load_dotenv(override=True)
+    return MappingProxyType({
+        provider: os.getenv(env_var, "") not in ("", placeholder)
+        for provider, (env_var, placeholder) in API_KEY_ENV_VARS.items()
+    })
+
+
+# Load environment variables before anything reads them
+_api_keys_configured()
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_graph():
+    """
+    Compile the LangGraph once per process and share it across reruns and sessions.
+    
+    The returned graph is shared - never mutate it in place.
+    """
+    from src.graph import get_runnable_graph
+    return get_runnable_graph()
+
+
+# Completed runs are persisted here as {run_id}.json, plus an index.json of labels
+RUNS_DIR = os.path.join(os.getcwd(), "runs")
+RUNS_INDEX_PATH = os.path.join(RUNS_DIR, "index.json")
+
+# A saved run younger than this is served as-is instead of re-running the pipeline
+RESEARCH_CACHE_TTL = timedelta(hours=1)
+
+
+def get_run_id(idea: str, region: str) -> str:
+    """Stable id for a research run, keyed on the normalized idea and region."""
+    key = f"{idea.strip().lower()}|{region}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+
+
+def _read_run_index() -> dict:
+    """Read the index of saved runs straight from disk."""
+    if not os.path.exists(RUNS_INDEX_PATH):
+        return {}
+    try:
+        with open(RUNS_INDEX_PATH, 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+
+@st.cache_data(show_spinner=False)
+def load_run_index() -> dict:
+    """Load the index of saved runs (run_id -> idea, region, saved_at)."""
+    return _read_run_index()
+
+
+def is_run_fresh(run_id: str) -> bool:
+    """Whether a saved run exists and is within RESEARCH_CACHE_TTL."""
+    saved_at = load_run_index().get(run_id, {}).get("saved_at")
+    if not saved_at or not os.path.exists(os.path.join(RUNS_DIR, f"{run_id}.json")):
+        return False
+    return datetime.now() - datetime.fromisoformat(saved_at) < RESEARCH_CACHE_TTL
+
+
+@st.cache_data(ttl="24h", max_entries=16, show_spinner=False)
+def load_run(run_id: str) -> dict:
+    """Load a saved run's final state from disk (None if missing or unreadable)."""
+    try:
+        with open(os.path.join(RUNS_DIR, f"{run_id}.json"), 'rb') as f:
+            return loads_state(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+@st.cache_resource(show_spinner=False)
+def _run_index_lock() -> threading.Lock:
+    """One lock per server process, so concurrent sessions don't lose index entries."""
+    return threading.Lock()
+
+
+def _write_atomic(path: str, data: bytes):
+    """Write via a temp file and os.replace, so readers never see a partial file."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def save_run(run_id: str, state: dict):
+    """Persist a completed run to disk and add it to the run index."""
+    os.makedirs(RUNS_DIR, exist_ok=True)
+    
+    _write_atomic(
+        os.path.join(RUNS_DIR, f"{run_id}.json"),
+        dumps_state(state),
+    )
+    
+    # Re-read the index from disk under the lock, not from the cache, so an
+    # entry saved by another session in the meantime is kept
+    with _run_index_lock():
+        index = _read_run_index()
+        index[run_id] = {
+            "idea": state.get("raw_idea", ""),
+            "region": state.get("target_region", ""),
+            "saved_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        _write_atomic(RUNS_INDEX_PATH, orjson.dumps(index, option=orjson.OPT_INDENT_2))
+    
+    # Drop stale cached copies so the new run is picked up
+    load_run_index.clear()
+    load_run.clear()
+
+
 def init_session_state():
     """Initialize session state variables."""
-    if 'research_state' not in st.session_state:
-        st.session_state.research_state = None
+    if 'run_id' not in st.session_state:
+        st.session_state.run_id = None
+    if 'unsaved_run' not in st.session_state:
+        # (run_id, state) of a finished run that couldn't be written to disk
+        st.session_state.unsaved_run = None
     if 'is_running' not in st.session_state:
         st.session_state.is_running = False
     if 'current_agent' not in st.session_state:
         st.session_state.current_agent = None
     if 'agent_logs' not in st.session_state:
         st.session_state.agent_logs = []
+    if 'completed_agents' not in st.session_state:
+        st.session_state.completed_agents = set()
     if 'idea_input' not in st.session_state:
         st.session_state.idea_input = ""
     if 'region_input' not in st.session_state:
@@ -82,14 +236,8 @@ def render_sidebar():
         )
         
         # API Key check - need all 3 keys
-        perplexity_key = os.getenv("PERPLEXITY_API_KEY", "")
-        google_key = os.getenv("GOOGLE_API_KEY", "")
-        tavily_key = os.getenv("TAVILY_API_KEY", "")
-        api_keys_valid = (
-            perplexity_key and perplexity_key != "your_perplexity_api_key_here" and
-            google_key and google_key != "your_google_api_key_here" and
-            tavily_key and tavily_key != "your_tavily_api_key_here"
-        )
+        keys = _api_keys_configured()
+        api_keys_valid = all(keys.values())
         run_disabled = not (idea and api_keys_valid)
         
         # ======== PROMINENT ENTER BUTTON ========
@@ -109,22 +257,36 @@ def render_sidebar():
         
         st.markdown("---")
         
+        # Previously saved runs
+        run_index = load_run_index()
+        if run_index:
+            run_ids = sorted(run_index, key=lambda r: run_index[r].get("saved_at", ""), reverse=True)
+            st.selectbox(
+                "📂 Previous Runs",
+                [None] + run_ids,
+                format_func=lambda r: "Select a saved run..." if r is None else (
+                    f"{run_index[r].get('idea', r)[:40]} ({run_index[r].get('region', '')})"
+                ),
+                key="saved_run_select",
+                on_change=lambda: st.session_state.update(run_id=st.session_state.saved_run_select)
+            )
+        
         # API Key status (collapsed by default)
         with st.expander("🔑 API Keys", expanded=False):
             st.caption("**Research LLM (Perplexity)**")
-            if perplexity_key and perplexity_key != "your_perplexity_api_key_here":
+            if keys["perplexity"]:
                 st.success("✅ Perplexity API Key")
             else:
                 st.error("❌ Perplexity API Key missing")
             
             st.caption("**Analysis LLM (Gemini)**")
-            if google_key and google_key != "your_google_api_key_here":
+            if keys["google"]:
                 st.success("✅ Google API Key")
             else:
                 st.error("❌ Google API Key missing")
             
             st.caption("**Web Search (Tavily)**")
-            if tavily_key and tavily_key != "your_tavily_api_key_here":
+            if keys["tavily"]:
                 st.success("✅ Tavily API Key")
             else:
                 st.error("❌ Tavily API Key missing")
@@ -137,26 +299,16 @@ def render_sidebar():
 
 def render_agent_progress():
     """Render the agent progress tracker."""
-    agents = [
-        ("🔍", "Strategist", "Searching for pain points"),
-        ("✓", "Critic", "Verifying with statistics"),
-        ("🕵️", "Infiltrator", "Analyzing competitors"),
-        ("👥", "Anthropologist", "Creating personas"),
-        ("📊", "Analyzer", "Building competitor matrix"),
-        ("💡", "Innovator", "Proposing features"),
-        ("💰", "Auditor", "Validating financials"),
-        ("📄", "PDF Compiler", "Generating report"),
-    ]
-    
-    current = st.session_state.current_agent
-    
-    cols = st.columns(len(agents))
-    for i, (icon, name, desc) in enumerate(agents):
+    current_norm = (st.session_state.current_agent or "").lower().replace("_", "")
+    completed = st.session_state.completed_agents
+    
+    cols = st.columns(len(AGENTS))
+    for i, (icon, name, desc) in enumerate(AGENTS):
         with cols[i]:
-            if current and name.lower() == current.lower().replace("_", ""):
+            if current_norm and name.lower() == current_norm:
                 st.markdown(f"**{icon} {name}**")
                 st.caption(f"⏳ {desc}...")
-            elif name.lower() in [log.lower() for log in st.session_state.agent_logs]:
+            elif name.lower().replace(" ", "_") in completed:
                 st.markdown(f"✅ {name}")
                 st.caption("Complete")
             else:
@@ -164,8 +316,81 @@ def render_agent_progress():
                 st.caption(desc)
 
 
+def shorten_for_display(text: str, key: str, width: int = 200) -> str:
+    """
+    Return text capped at `width` characters, with a "Show full" toggle when
+    it is longer so the full string is only sent to the browser on request.
+    Non-string values (e.g. a null field from the LLM) are returned unchanged.
+    """
+    if not isinstance(text, str) or len(text) <= width:
+        return text
+    if st.toggle("Show full", key=key):
+        return text
+    preview = textwrap.shorten(text, width=width, placeholder="…")
+    # shorten() drops a first word that is longer than width entirely
+    return preview if preview != "…" else text[:width - 1] + "…"
+
+
+@st.cache_data(
+    max_entries=8,
+    show_spinner=False,
+    hash_funcs={list: lambda items: orjson.dumps(items, default=str, option=STATE_JSON_OPTIONS)}
+)
+def build_table_frame(items: list, columns: tuple) -> pd.DataFrame:
+    """
+    Build the display DataFrame for a results table.
+    
+    Cached on the items' content (hashed via orjson), so tab reruns over the
+    same research results reuse the frame instead of rebuilding it.
+    """
+    frame = pd.DataFrame(items).reindex(columns=list(columns))
+    # Compound scores carry 4 decimals; float32 holds them at half the width
+    if 'sentiment_score' in frame:
+        frame['sentiment_score'] = frame['sentiment_score'].astype('float32')
+    return frame
+
+
+def render_selectable_table(items: list, columns: dict, key: str, column_config: dict = None):
+    """
+    Render items as a single table with row selection.
+    
+    Args:
+        items: List of result dicts
+        columns: Mapping of dict key -> column label, in display order
+        key: Widget key for the table
+        column_config: Optional per-column st.column_config overrides
+    
+    Returns:
+        The selected item, or None if no row is selected
+    """
+    df = build_table_frame(items, tuple(columns))
+    config = {col: label for col, label in columns.items()}
+    config.update(column_config or {})
+    
+    event = st.dataframe(
+        df,
+        column_config=config,
+        hide_index=True,
+        selection_mode="single-row",
+        on_select="rerun",
+        key=key
+    )
+    
+    rows = event.selection.rows
+    if not rows:
+        st.caption("Select a row to see details.")
+        return None
+    return items[rows[0]]
+
+
+@st.fragment
 def render_results(state: dict):
-    """Render the research results."""
+    """
+    Render the research results.
+    
+    Runs as a fragment (as do the per-tab renderers), so widget interactions
+    inside the results only rerun that subtree instead of the whole page.
+    """
     if not state:
         return
     
@@ -198,6 +423,23 @@ def render_results(state: dict):
         render_financials(state)
 
 
+def get_report_bytes(state: dict) -> bytes:
+    """
+    Return the Markdown report as bytes, encoding it only once per run.
+    
+    The encoded report is kept in session state so reruns of the Overview tab
+    hand the download button the same bytes object instead of re-encoding.
+    It is keyed on the run's save time as well as its id, since re-running the
+    same idea and region overwrites the saved run with a new report.
+    """
+    run_id = get_run_id(state.get('raw_idea', ''), state.get('target_region', ''))
+    report_version = (run_id, load_run_index().get(run_id, {}).get('saved_at'))
+    if st.session_state.get('report_version') != report_version:
+        st.session_state.report_bytes = state.get('report_markdown', '').encode('utf-8')
+        st.session_state.report_version = report_version
+    return st.session_state.report_bytes
+
+
 def render_overview(state: dict):
     """Render the overview tab."""
     st.header("Research Overview")
@@ -254,12 +496,13 @@ def render_overview(state: dict):
         st.subheader("📥 Download Report")
         st.download_button(
             label="Download Markdown Report",
-            data=state.get('report_markdown', ''),
+            data=get_report_bytes(state),
             file_name=f"research_report_{datetime.now().strftime('%Y%m%d')}.md",
             mime="text/markdown"
         )
 
 
+@st.fragment
 def render_pain_points(state: dict):
     """Render the pain points tab."""
     st.header("Verified Pain Points")
@@ -270,8 +513,18 @@ def render_pain_points(state: dict):
         st.info("No verified pain points yet.")
         return
     
-    for i, pain in enumerate(pains, 1):
-        with st.expander(f"Pain #{i}: {pain.get('pain', 'Unknown')[:60]}..."):
+    pain = render_selectable_table(
+        pains,
+        {"pain": "Pain", "stat": "Statistic", "source": "Source", "year": "Year", "sentiment_score": "Sentiment"},
+        key="pains_table",
+        column_config={
+            "year": st.column_config.NumberColumn("Year", format="%d"),
+            "sentiment_score": st.column_config.NumberColumn("Sentiment", format="%.2f"),
+        }
+    )
+    
+    if pain:
+        with st.container(border=True):
             col1, col2 = st.columns([2, 1])
             
             with col1:
@@ -287,6 +540,7 @@ def render_pain_points(state: dict):
                          delta_color="normal" if sentiment < 0 else "inverse")
 
 
+@st.fragment
 def render_competitors(state: dict):
     """Render the competitors tab."""
     st.header("Competitive Landscape")
@@ -297,8 +551,16 @@ def render_competitors(state: dict):
         st.info("No competitor data yet.")
         return
     
-    for comp in competitors:
-        with st.expander(f"🏢 {comp.get('name', 'Unknown')}"):
+    comp = render_selectable_table(
+        competitors,
+        {"name": "Competitor", "url": "URL", "best_at": "Best At", "lag": "Lag", "lack": "Lack", "gap": "Gap"},
+        key="competitors_table",
+        column_config={"url": st.column_config.LinkColumn("URL")}
+    )
+    
+    if comp:
+        with st.container(border=True):
+            st.markdown(f"#### 🏢 {comp.get('name', 'Unknown')}")
             col1, col2 = st.columns(2)
             
             with col1:
@@ -313,9 +575,11 @@ def render_competitors(state: dict):
             # Dark patterns
             dark_patterns = comp.get('dark_patterns_detected', []) or comp.get('scraped_dark_patterns', {}).get('dark_patterns_found', [])
             if dark_patterns:
-                st.warning(f"⚠️ Dark Patterns Detected: {', '.join(dark_patterns)}")
+                patterns = shorten_for_display(', '.join(dark_patterns), key="full_dark_patterns")
+                st.warning(f"⚠️ Dark Patterns Detected: {patterns}")
 
 
+@st.fragment
 def render_personas(state: dict):
     """Render the personas tab."""
     st.header("Target Personas")
@@ -326,16 +590,11 @@ def render_personas(state: dict):
         st.info("No personas created yet.")
         return
     
-    # Group by segment
-    segments = {"India 1": [], "India 2": [], "India 3": []}
-    for persona in personas:
-        segment = persona.get('segment', 'India 1')
-        if segment in segments:
-            segments[segment].append(persona)
-    
-    for segment, segment_personas in segments.items():
+    # Grouped by segment in the Anthropologist step
+    for segment, segment_personas in state.get('personas_by_segment', {}).items():
         if segment_personas:
-            st.subheader(f"🇮🇳 {segment}")
+            icon = "🇮🇳" if segment.startswith("India") else "👥"
+            st.subheader(f"{icon} {segment}")
             
             cols = st.columns(len(segment_personas))
             for i, persona in enumerate(segment_personas):
@@ -350,9 +609,13 @@ def render_personas(state: dict):
                     st.markdown(f"💻 Tech: {persona.get('tech_comfort', 'N/A')}")
                     
                     with st.expander("Full Profile"):
-                        st.write(persona.get('description', 'No description'))
+                        st.write(shorten_for_display(
+                            persona.get('description') or 'No description',
+                            key=f"full_profile_{segment}_{i}"
+                        ))
 
 
+@st.fragment
 def render_features(state: dict):
     """Render the features tab."""
     st.header("Proposed Features (by RICE Score)")
@@ -379,8 +642,22 @@ def render_features(state: dict):
     st.markdown("---")
     
     # Feature table
-    for i, feature in enumerate(features[:15], 1):
-        with st.expander(f"#{i} {feature.get('name', 'Unknown')} (RICE: {feature.get('rice_score', 0):,.0f})"):
+    feature = render_selectable_table(
+        features,
+        {
+            "name": "Feature", "rice_score": "RICE", "reach": "Reach", "impact": "Impact",
+            "confidence": "Confidence", "effort": "Effort (weeks)", "delta_4_claim": "Delta-4 Claim"
+        },
+        key="features_table",
+        column_config={
+            "rice_score": st.column_config.NumberColumn("RICE", format="%.0f"),
+            "confidence": st.column_config.ProgressColumn("Confidence", min_value=0, max_value=1, format="%.2f"),
+        }
+    )
+    
+    if feature:
+        with st.container(border=True):
+            st.markdown(f"#### {feature.get('name', 'Unknown')} (RICE: {feature.get('rice_score', 0):,.0f})")
             col1, col2 = st.columns([2, 1])
             
             with col1:
@@ -396,6 +673,7 @@ def render_features(state: dict):
                 st.metric("Effort", f"{feature.get('effort', 0)} weeks")
 
 
+@st.fragment
 def render_financials(state: dict):
     """Render the financials tab."""
     st.header("Financial Projections")
@@ -451,31 +729,47 @@ def render_financials(state: dict):
             st.markdown(f"• {cost}")
 
 
+async def _stream_research(graph, initial_state: dict, on_update=None) -> dict:
+    """
+    Stream the graph with astream, merging each node's update into the final state.
+    
+    Agent nodes are synchronous, so LangGraph runs them in worker threads while this
+    loop stays free to hand progress events to on_update between steps.
+    """
+    # Build the final state from the streamed updates instead of re-running the graph
+    final_state = dict(initial_state)
+    async for event in graph.astream(initial_state, stream_mode="updates"):
+        for node_name, state_update in event.items():
+            final_state.update(state_update or {})
+            if on_update:
+                on_update(node_name, state_update)
+    
+    return final_state
+
+
 def run_research_pipeline(idea: str, region: str):
-    """Run the research pipeline with progress updates and live logging."""
-    from src.graph import get_runnable_graph, create_initial_state
+    """
+    Run the research pipeline with progress updates and live logging.
+    
+    Repeating an idea and region within RESEARCH_CACHE_TTL serves the saved
+    run from disk and skips the pipeline (and its progress UI) entirely.
+    """
     import time
+    from collections import deque
+    from src.graph import create_initial_state
     
-    st.session_state.is_running = True
-    st.session_state.agent_logs = []
+    st.session_state.completed_agents = set()
+    run_id = get_run_id(idea, region)
     
-    # Agent information for display
-    agent_info = {
-        "strategist": ("🔍", "Strategist", "Searching for pain points..."),
-        "critic": ("✓", "Critic", "Verifying with statistics..."),
-        "infiltrator": ("🕵️", "Infiltrator", "Analyzing competitors..."),
-        "anthropologist": ("👥", "Anthropologist", "Creating personas..."),
-        "analyzer": ("📊", "Analyzer", "Building competitor matrix..."),
-        "innovator": ("💡", "Innovator", "Proposing features..."),
-        "auditor": ("💰", "Auditor", "Validating financials..."),
-        "pdf_compiler": ("📄", "PDF Compiler", "Generating report..."),
-    }
-    
-    # Create initial state
-    initial_state = create_initial_state(idea, region)
+    saved_state = load_run(run_id) if is_run_fresh(run_id) else None
+    if saved_state is not None:
+        timestamp = time.strftime("%H:%M:%S")
+        st.session_state.agent_logs = [f"✅ [{timestamp}] Loaded cached research for: {idea} ({region})"]
+        st.session_state.run_id = run_id
+        return saved_state
     
-    # Get the compiled graph
-    graph = get_runnable_graph()
+    st.session_state.is_running = True
+    st.session_state.agent_logs = []
     
     # Create UI containers
     st.markdown("## 🔄 Research in Progress")
@@ -486,9 +780,6 @@ def run_research_pipeline(idea: str, region: str):
     # Progress bar
     progress_bar = st.progress(0, text="Starting research pipeline...")
     
-    # Log container
-    log_container = st.container()
-    
     # Status container for current agent
     status_container = st.empty()
     
@@ -496,9 +787,15 @@ def run_research_pipeline(idea: str, region: str):
     with st.expander("📋 Live Execution Log", expanded=True):
         log_placeholder = st.empty()
     
-    logs = []
-    completed_agents = []
-    total_agents = 8
+    # Bounded so the log (and every join over it) stays cheap on long runs
+    logs = deque(maxlen=500)
+    last_flush = [0.0]
+    total_agents = len(AGENT_INFO)
+    
+    def flush_log():
+        """Redraw the live log from the buffered entries."""
+        log_placeholder.code("\n".join(logs), language=None)
+        last_flush[0] = time.monotonic()
     
     def add_log(message: str, level: str = "info"):
         """Add a log entry with timestamp."""
@@ -512,81 +809,80 @@ def run_research_pipeline(idea: str, region: str):
         else:
             logs.append(f"ℹ️ [{timestamp}] {message}")
         
-        # Update log display
-        log_placeholder.code("\n".join(logs), language=None)
+        # Throttle redraws to ~10/s, but always show successes and errors right away
+        if level in ("success", "error") or time.monotonic() - last_flush[0] > 0.1:
+            flush_log()
+    
+    def on_update(node_name: str, state_update: dict):
+        """Reflect a single graph event in the progress UI."""
+        completed_agents = st.session_state.completed_agents
+        current_step = len(completed_agents | {node_name})
+        
+        # Get agent info
+        icon, name, desc = AGENT_INFO.get(node_name, ("🔄", node_name, "Processing"))
+        
+        # Update status
+        status_container.info(f"{icon} **Currently running:** {name} - {desc}...")
+        
+        # Update progress
+        progress = min(current_step / total_agents, 1.0)
+        progress_bar.progress(progress, text=f"Step {current_step}/{total_agents}: {name}")
+        
+        # Log completion
+        add_log(f"Completed: {name}", "success")
+        
+        # Log specific details based on agent
+        if node_name == "strategist":
+            pains_found = len(state_update.get('raw_pains', []))
+            add_log(f"  → Found {pains_found} potential pain points")
+        
+        elif node_name == "critic":
+            verified = len(state_update.get('verified_pains', []))
+            is_verified = state_update.get('is_verified', False)
+            add_log(f"  → Verified {verified} pain points")
+            if not is_verified:
+                add_log(f"  → Verification loop triggered", "warning")
+        
+        elif node_name == "infiltrator":
+            competitors = len(state_update.get('competitor_table', []))
+            add_log(f"  → Analyzed {competitors} competitors")
+        
+        elif node_name == "anthropologist":
+            personas = len(state_update.get('personas', []))
+            add_log(f"  → Created {personas} personas")
+        
+        elif node_name == "analyzer":
+            gaps = len(state_update.get('market_gaps', []))
+            add_log(f"  → Identified {gaps} market gaps")
+        
+        elif node_name == "innovator":
+            features = len(state_update.get('feature_list', []))
+            add_log(f"  → Proposed {features} features")
+        
+        elif node_name == "auditor":
+            is_viable = state_update.get('is_financially_viable', False)
+            revenue = state_update.get('revenue_model', {})
+            ratio = revenue.get('ltv_cac_ratio', 0)
+            add_log(f"  → LTV/CAC Ratio: {ratio:.2f}")
+            if is_viable:
+                add_log(f"  → Financially viable ✓", "success")
+            else:
+                add_log(f"  → Not viable - may loop to Innovator", "warning")
+        
+        elif node_name == "pdf_compiler":
+            add_log(f"  → Report generated")
+        
+        completed_agents.add(node_name)
+        # Show this agent's detail lines now; the next event may be an LLM call away
+        flush_log()
     
     add_log(f"Starting market research for: {idea}")
     add_log(f"Target region: {region}")
     add_log("Initializing LangGraph pipeline...")
     
     try:
-        # Stream through the graph
-        current_step = 0
-        
-        for event in graph.stream(initial_state):
-            for node_name, state_update in event.items():
-                current_step += 1
-                
-                # Get agent info
-                icon, name, desc = agent_info.get(node_name, ("🔄", node_name, "Processing..."))
-                
-                # Update status
-                status_container.info(f"{icon} **Currently running:** {name} - {desc}")
-                
-                # Update progress
-                progress = min(current_step / total_agents, 1.0)
-                progress_bar.progress(progress, text=f"Step {current_step}/{total_agents}: {name}")
-                
-                # Log completion
-                add_log(f"Completed: {name}", "success")
-                
-                # Log specific details based on agent
-                if node_name == "strategist":
-                    pains_found = len(state_update.get('raw_pains', []))
-                    add_log(f"  → Found {pains_found} potential pain points")
-                
-                elif node_name == "critic":
-                    verified = len(state_update.get('verified_pains', []))
-                    is_verified = state_update.get('is_verified', False)
-                    add_log(f"  → Verified {verified} pain points")
-                    if not is_verified:
-                        add_log(f"  → Verification loop triggered", "warning")
-                
-                elif node_name == "infiltrator":
-                    competitors = len(state_update.get('competitor_table', []))
-                    add_log(f"  → Analyzed {competitors} competitors")
-                
-                elif node_name == "anthropologist":
-                    personas = len(state_update.get('personas', []))
-                    add_log(f"  → Created {personas} personas")
-                
-                elif node_name == "analyzer":
-                    gaps = len(state_update.get('market_gaps', []))
-                    add_log(f"  → Identified {gaps} market gaps")
-                
-                elif node_name == "innovator":
-                    features = len(state_update.get('feature_list', []))
-                    add_log(f"  → Proposed {features} features")
-                
-                elif node_name == "auditor":
-                    is_viable = state_update.get('is_financially_viable', False)
-                    revenue = state_update.get('revenue_model', {})
-                    ratio = revenue.get('ltv_cac_ratio', 0)
-                    add_log(f"  → LTV/CAC Ratio: {ratio:.2f}")
-                    if is_viable:
-                        add_log(f"  → Financially viable ✓", "success")
-                    else:
-                        add_log(f"  → Not viable - may loop to Innovator", "warning")
-                
-                elif node_name == "pdf_compiler":
-                    report_path = state_update.get('final_report_path', '')
-                    add_log(f"  → Report generated")
-                
-                completed_agents.append(node_name)
-        
-        # Get final state by running invoke
-        add_log("Finalizing research results...")
-        final_state = graph.invoke(initial_state)
+        initial_state = create_initial_state(idea, region)
+        final_state = asyncio.run(_stream_research(_cached_graph(), initial_state, on_update))
         
         # Complete
         progress_bar.progress(1.0, text="✅ Research Complete!")
@@ -597,10 +893,19 @@ def run_research_pipeline(idea: str, region: str):
         add_log(f"Total competitors analyzed: {len(final_state.get('competitor_table', []))}")
         add_log(f"Total personas created: {len(final_state.get('personas', []))}")
         add_log(f"Total features proposed: {len(final_state.get('feature_list', []))}")
+        flush_log()
         
-        st.session_state.research_state = final_state
+        # Persisting is an optimization: if runs/ isn't writable, keep this
+        # session's result in memory rather than discarding a finished run
+        try:
+            save_run(run_id, final_state)
+        except (OSError, orjson.JSONEncodeError) as e:
+            add_log(f"Could not save run to disk: {e}", "warning")
+            flush_log()
+            st.session_state.unsaved_run = (run_id, final_state)
+        st.session_state.run_id = run_id
         st.session_state.is_running = False
-        st.session_state.agent_logs = logs
+        st.session_state.agent_logs = list(logs)
         
         return final_state
         
@@ -629,22 +934,27 @@ def main():
     # Run research if button clicked
     if should_run and idea:
         # Clear previous results
-        st.session_state.research_state = None
+        st.session_state.run_id = None
+        st.session_state.unsaved_run = None
         result = run_research_pipeline(idea, region)
         if result:
+            # Results are drawn below in this same pass - no st.rerun() needed
             st.success("✅ Research complete! Scroll down to see results.")
             st.balloons()
-            # Rerun to show results properly
-            st.rerun()
     
-    # Show previous logs if available
-    if st.session_state.agent_logs and not st.session_state.is_running:
+    # Show previous logs if available (the live log is already on screen after a run)
+    if st.session_state.agent_logs and not st.session_state.is_running and not should_run:
         with st.expander("📋 Previous Execution Log", expanded=False):
             st.code("\n".join(st.session_state.agent_logs), language=None)
     
-    # Show results if available
-    if st.session_state.research_state:
-        render_results(st.session_state.research_state)
+    # Show results if available (loaded from disk, cached; in memory if unsaved)
+    run_id = st.session_state.run_id
+    state = load_run(run_id) if run_id else None
+    unsaved_run = st.session_state.unsaved_run
+    if state is None and unsaved_run and unsaved_run[0] == run_id:
+        state = unsaved_run[1]
+    if state is not None:
+        render_results(state)
     else:
         # Welcome screen
         st.markdown("""
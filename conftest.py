@@ -0,0 +1,2 @@
+# Root conftest: makes `pytest` put the repo root on sys.path, so tests can
+# import the `src` package the same way app.py and main.py do.
@@ -44,16 +44,24 @@ def run_research(idea: str, region: str = "India") -> dict:
     # Run the graph with streaming to show progress
     print("📊 Running research pipeline...\n")
     
+    # Build the final state from the streamed updates instead of re-running the graph
+    final_state = dict(initial_state)
     current_node = None
-    for event in graph.stream(initial_state):
+    
+    for event in graph.stream(initial_state, stream_mode="updates"):
         # Extract the node name and state update
+        out = []
         for node_name, state_update in event.items():
+            final_state.update(state_update or {})
             if node_name != current_node:
                 current_node = node_name
-                print(f"✓ Completed: {node_name.replace('_', ' ').title()}")
-    
-    # Get final state
-    final_state = graph.invoke(initial_state)
+                out.append(f"✓ Completed: {node_name.replace('_', ' ').title()}\n")
+        
+        # One write per event: nodes finish seconds apart (each spans an LLM
+        # call), so holding lines back would only delay them
+        if out:
+            sys.stdout.write("".join(out))
+            sys.stdout.flush()
     
     print(f"\n{'='*60}")
     print("✅ Research Complete!")
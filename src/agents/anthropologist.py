@@ -31,6 +31,7 @@ def run_anthropologist(state: MarketState) -> Dict[str, Any]:
     
     Outputs to state:
         - personas: 10 detailed user personas
+        - personas_by_segment: The same personas grouped by segment
     """
     idea = state.get("raw_idea", "")
     verified_pains = state.get("verified_pains", [])
@@ -106,7 +107,16 @@ Return your response as valid JSON matching the output format specified.
         if segment in segment_counts:
             segment_counts[segment] += 1
     
+    # Group personas by segment once here, so the UI doesn't regroup on every render.
+    # Keys come from the data; a missing or null segment falls back to India 1, and
+    # everything is coerced to str so mixed LLM output still sorts.
+    personas_by_segment = {}
+    for persona in personas:
+        segment = str(persona.get("segment") or "India 1")
+        personas_by_segment.setdefault(segment, []).append(persona)
+    
     return {
         "personas": personas,
+        "personas_by_segment": dict(sorted(personas_by_segment.items())),
         "persona_distribution": segment_counts
     }
@@ -18,7 +18,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from src.graph.state import MarketState
 from src.config.prompts import STRATEGIST_PROMPT
 from src.utils.llm import get_research_llm
-from src.utils.sentiment import filter_genuine_pains, analyze_pain_points
+from src.utils.sentiment import analyze_pain_points
 from src.tools.search import (
     search_community_sources,
     search_indian_sources,
@@ -108,7 +108,8 @@ Return your response as valid JSON matching the output format specified.
     
     # Apply sentiment analysis to filter genuine pains
     analyzed_pains = analyze_pain_points(raw_pains)
-    genuine_pains = filter_genuine_pains(raw_pains)
+    # Reuse the scores just computed rather than running VADER a second time
+    genuine_pains = [p for p in analyzed_pains if p['is_genuine_pain']]
     
     return {
         "raw_pains": analyzed_pains,  # Keep all for transparency
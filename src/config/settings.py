@@ -65,6 +65,10 @@ MIN_CONFIDENCE_THRESHOLD = 15
 # VADER scores range from -1 (negative) to +1 (positive)
 MAX_SENTIMENT_FOR_PAIN = -0.3  # Anything above this is "not painful enough"
 
+# Use the optimized VADER analyzer; set USE_FAST_SENTIMENT=false to fall back
+# to the stock vaderSentiment implementation (scores are identical)
+USE_FAST_SENTIMENT = os.getenv("USE_FAST_SENTIMENT", "true").lower() == "true"
+
 # ===== FINANCIAL VIABILITY =====
 # The Auditor will reject ideas where LTV/CAC is below this
 MIN_LTV_CAC_RATIO = 3.0
@@ -88,6 +88,7 @@ class MarketState(TypedDict):
     
     # ===== PERSONAS (Anthropologist) =====
     personas: List[Persona]
+    personas_by_segment: Dict[str, List[Persona]]  # Grouped once for the UI
     
     # ===== FEATURES (Innovator) =====
     feature_list: List[Feature]
@@ -48,6 +48,7 @@ def create_initial_state(raw_idea: str, target_region: str = "India") -> MarketS
         
         # Personas
         "personas": [],
+        "personas_by_segment": {},
         
         # Features
         "feature_list": [],
@@ -5,14 +5,18 @@ Wraps Tavily for market research purposes with Indian domain priorities.
 """
 
 import os
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from langchain_community.tools.tavily_search import TavilySearchResults
 from src.config.settings import TAVILY_API_KEY
 
 
+@lru_cache(maxsize=None)
 def get_search_tool(max_results: int = 5) -> TavilySearchResults:
     """
     Returns a configured Tavily search tool.
+    
+    Cached per max_results so repeated searches reuse the same client.
     """
     if not TAVILY_API_KEY:
         raise ValueError(
@@ -4,3 +4,4 @@ from .scoring import get_domain_trust_score, calculate_claim_confidence, is_clai
 from .financials import analyze_financials, dict_to_inputs, generate_projection_table
 from .rice import calculate_rice_score, score_features, get_top_features
 from .llm import get_llm
+from .serialization import dumps_state, loads_state
@@ -5,6 +5,7 @@ LLM Configuration - Dual LLM system for optimal performance.
 - Gemini: Analysis & synthesis (better at structured output)
 """
 
+from functools import lru_cache
 from langchain_openai import ChatOpenAI
 from langchain_google_genai import ChatGoogleGenerativeAI
 from src.config.settings import (
@@ -14,10 +15,13 @@ from src.config.settings import (
 )
 
 
+@lru_cache(maxsize=None)
 def get_research_llm() -> ChatOpenAI:
     """
     Returns Perplexity LLM for research tasks.
     
+    The client is built once per process and reused by every agent call.
+    
     Best for: Strategist, Critic, Infiltrator
     - Built-in web search capabilities
     - Good at finding facts and citations
@@ -35,10 +39,13 @@ def get_research_llm() -> ChatOpenAI:
     )
 
 
+@lru_cache(maxsize=None)
 def get_analysis_llm() -> ChatGoogleGenerativeAI:
     """
     Returns Gemini LLM for analysis tasks.
     
+    The client is built once per process and reused by every agent call.
+    
     Best for: Anthropologist, Analyzer, Innovator, Auditor, PDF Compiler
     - Better at structured output and synthesis
     - Good at creative and analytical tasks
@@ -0,0 +1,54 @@
+"""
+JSON (de)serialization of research state for on-disk runs.
+
+orjson is several times faster than the stdlib json module on the nested
+state dicts, but it writes inf/NaN as null. The auditor's financial model
+produces inf (e.g. LTV/CAC when CAC is 0), so non-finite floats are tagged
+on the way out and restored on the way back in.
+"""
+
+import math
+from typing import Any, Dict
+
+import numpy as np
+import orjson
+
+# orjson handles numpy values (e.g. from the pandas projections) and non-str keys
+STATE_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# {"__non_finite__": "inf"} stands in for a float orjson can't represent
+_NON_FINITE_KEY = "__non_finite__"
+
+
+def _encode_non_finite(value: Any) -> Any:
+    """Recursively replace inf/-inf/NaN with tagged markers."""
+    if isinstance(value, (float, np.floating)):
+        return value if math.isfinite(value) else {_NON_FINITE_KEY: repr(float(value))}
+    if isinstance(value, dict):
+        return {key: _encode_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_non_finite(item) for item in value]
+    if isinstance(value, np.ndarray) and value.dtype.kind == 'f' and not np.isfinite(value).all():
+        return _encode_non_finite(value.tolist())
+    return value
+
+
+def _decode_non_finite(value: Any) -> Any:
+    """Recursively turn tagged markers back into floats."""
+    if isinstance(value, dict):
+        if len(value) == 1 and _NON_FINITE_KEY in value:
+            return float(value[_NON_FINITE_KEY])
+        return {key: _decode_non_finite(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode_non_finite(item) for item in value]
+    return value
+
+
+def dumps_state(state: Dict[str, Any]) -> bytes:
+    """Serialize a research state to JSON bytes, preserving non-finite floats."""
+    return orjson.dumps(_encode_non_finite(state), default=str, option=STATE_JSON_OPTIONS)
+
+
+def loads_state(data: bytes) -> Dict[str, Any]:
+    """Inverse of dumps_state. Raises orjson.JSONDecodeError on malformed input."""
+    return _decode_non_finite(orjson.loads(data))
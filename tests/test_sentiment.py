@@ -0,0 +1,115 @@
+"""
+Regression tests for the VADER sentiment engine.
+"""
+
+import random
+
+import pytest
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer, SPECIAL_CASES, BOOSTER_DICT
+
+from src.utils import sentiment
+from src.utils.sentiment import MAX_SENTIMENT_TEXT_LENGTH, MAX_SENTIMENT_TOKENS, _prepare_text
+
+
+def _expanded_token_count(text: str) -> int:
+    """Token count of `text` after VADER's emoji-to-description expansion."""
+    emojis = sentiment._analyzer.emojis
+    return len("".join(f" {emojis[c]} " if c in emojis else c for c in text).split())
+
+
+def test_long_text_is_length_capped():
+    assert len(_prepare_text("this is awful " * 2000)) <= MAX_SENTIMENT_TEXT_LENGTH
+
+
+def test_emoji_runs_keep_punctuation_emphasis():
+    analyzer = sentiment._analyzer
+    assert _prepare_text("terrible!!!!!!!!!!") == "terrible!!!!"
+    assert (
+        analyzer.polarity_scores(_prepare_text("terrible!!!!!!!!!!"))["compound"]
+        == analyzer.polarity_scores("terrible!!!!!!!!!!")["compound"]
+    )
+
+
+def test_varied_emoji_spam_is_capped_after_expansion():
+    # Non-repeating emoji slip past the run collapse, and each one expands to
+    # a multi-word description, so 5000 chars become ~10k tokens uncapped
+    emojis = [c for c in sentiment._analyzer.emojis if len(c) == 1]
+    spam = "".join(emojis[i % len(emojis)] for i in range(MAX_SENTIMENT_TEXT_LENGTH))
+
+    assert _expanded_token_count(spam) > 5 * MAX_SENTIMENT_TOKENS
+    assert _expanded_token_count(_prepare_text(spam)) <= MAX_SENTIMENT_TOKENS
+
+
+def test_normal_text_is_untouched():
+    for text in ("The app crashes every time I pay 😡", "बहुत खराब सेवा", "works fine"):
+        assert _prepare_text(text) == text
+
+
+# FastSentimentIntensityAnalyzer re-implements VADER internals, so it is pinned
+# to the stock analyzer: a vaderSentiment upgrade that changes the rules fails here.
+STOCK = SentimentIntensityAnalyzer()
+FAST = sentiment.FastSentimentIntensityAnalyzer()
+
+
+@pytest.mark.parametrize("text", [
+    "this is not good",
+    "it isn't bad at all",
+    "I never liked it",
+    "never so happy with an app",
+    "this was never this good",
+    "without doubt the best tool",
+    "not without doubt a great app",
+    "at least it works",
+    "the least helpful support",
+    "yeah right, great service",
+    "this app is the bomb",
+    "kiss of death for my startup",
+    "it is kind of good but sort of slow",
+    "The UI is GREAT but the sync is NOT reliable!!!",
+    "I hate this 😡",
+])
+def test_fast_analyzer_matches_stock_on_rule_cases(text):
+    assert FAST.polarity_scores(text) == STOCK.polarity_scores(text)
+
+
+def test_fast_analyzer_matches_stock_on_random_sequences():
+    rng = random.Random(7)
+    vocab = list(STOCK.lexicon)[:3000] + [
+        "not", "never", "so", "this", "without", "doubt", "no", "least", "at",
+        "very", "but", "isn't", "nor", "BAD", "GREAT", "!!!", "?", "😡", "🙂", ":(", ":)",
+    ]
+    vocab += [word for phrase in list(SPECIAL_CASES) + list(BOOSTER_DICT) for word in phrase.split()]
+    for _ in range(5000):
+        text = " ".join(rng.choice(vocab) for _ in range(rng.randint(1, 30)))
+        assert FAST.polarity_scores(text) == STOCK.polarity_scores(text), text
+
+
+def test_negative_prescan_is_sound():
+    # is_genuine_pain skips VADER when _may_be_negative is False, which is only
+    # safe if such text can never score below zero
+    rng = random.Random(11)
+    plain = "the a product app it works when I use this software team and or to of in".split()
+    tricky = (
+        "kind of sort just enough yeah right kiss death the bus stop not never least "
+        "slightly barely but VERY GOOD !!! ??? :) :( no isn't don't without"
+    ).split()
+    lexicon = list(STOCK.lexicon)
+    skipped = 0
+    for _ in range(20000):
+        pool = plain * 4 + rng.sample(lexicon, 5) + tricky
+        words = rng.choices(pool, k=rng.randint(1, 15))
+        words = [w.upper() if rng.random() < 0.1 else w for w in words]
+        text = " ".join(w + rng.choice(["", ",", ".", "!", "?"]) for w in words)
+        if not sentiment._may_be_negative(text):
+            skipped += 1
+            assert sentiment._score(text) >= 0, text
+        assert sentiment.is_genuine_pain(text) == (sentiment._score(text) < sentiment.MAX_SENTIMENT_FOR_PAIN), text
+    # The fast path must actually fire for the test to mean anything
+    assert skipped > 1000
+
+
+def test_negative_prescan_sees_the_truncated_text():
+    # The 5000-char cut turns "badge" into "bad", which scores negative
+    text = "the " * 1248 + "then badge"
+    assert sentiment._score(text) < sentiment.MAX_SENTIMENT_FOR_PAIN
+    assert sentiment.is_genuine_pain(text)
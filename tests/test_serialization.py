@@ -0,0 +1,44 @@
+"""
+Round-trip tests for the on-disk research state format.
+"""
+
+import math
+
+import numpy as np
+
+from src.utils.serialization import dumps_state, loads_state
+
+
+def test_infinite_financials_survive_round_trip():
+    # analyze_financials yields inf LTV/CAC and payback when CAC or churn is 0
+    state = {
+        "revenue_model": {
+            "ltv": float("inf"),
+            "ltv_cac_ratio": float("inf"),
+            "payback_months": float("-inf"),
+            "cac": 0.0,
+        },
+        "projection": [np.float64("inf"), 1.5],
+    }
+
+    loaded = loads_state(dumps_state(state))
+
+    model = loaded["revenue_model"]
+    assert model["ltv"] == float("inf")
+    assert model["ltv_cac_ratio"] == float("inf")
+    assert model["payback_months"] == float("-inf")
+    assert model["cac"] == 0.0
+    assert loaded["projection"] == [float("inf"), 1.5]
+    # The UI formats these directly, e.g. f"{ltv_cac:.2f}"
+    assert f"{model['ltv_cac_ratio']:.2f}" == "inf"
+
+
+def test_nan_and_plain_values_round_trip():
+    state = {"score": float("nan"), "name": "Infinity", "items": [{"n": 1}], "ok": True}
+
+    loaded = loads_state(dumps_state(state))
+
+    assert math.isnan(loaded["score"])
+    assert loaded["name"] == "Infinity"
+    assert loaded["items"] == [{"n": 1}]
+    assert loaded["ok"] is True